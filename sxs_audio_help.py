@@ -0,0 +1,47 @@
+import streamlit as st
+from typing import FrozenSet
+
+# IDs and the language list bypass Markdown; the rest is split into stable blocks
+_EXAMPLES_HEADER_MD = "### 📊 Examples\n\n#### Sample Question IDs:"
+_EXAMPLE_QUESTION_IDS = (
+    ("30aeeee4a88e5dd6e04a0c5fd0400b4a+bard_data+coach_P128214_quality_gemini_live_sxs_e2e_experience_monolingual_human_eval_zh-CN+INTERNAL+en:4938557666299164772",
+     "**Detected:** Language=zh-CN, Project=Monolingual"),
+    ("deca6778ec3c6732889541e47526462c+bard_data+coach_P128239_quality_gemini_live_sxs_e2e_experience_audio_out_human_eval_de-DE+INTERNAL+en:5086465366914833277",
+     "**Detected:** Language=de-DE, Project=Audio Out"),
+    ("ee237a0a92ecf99df4fa773ec17ef8c8+bard_data+coach_P128260_quality_gemini_live_sxs_e2e_experience_code_mixed_human_eval_es-en+INTERNAL+en:16950462059114391870",
+     "**Detected:** Language=es-en, Project=Mixed"),
+)
+_EXAMPLES_BLOCKS = (
+    """#### Project Types:
+- **Monolingual**: Single language audio content
+- **Audio Out**: Text-to-speech evaluation
+- **Mixed**: Code-mixed or multilingual content
+- **Language Learning**: Educational language content""",
+    """#### Model Combinations:
+- **Gemini vs ChatGPT**: Standard comparison setup
+- **ChatGPT vs Gemini**: Alternative order for testing""",
+    """#### SxS Evaluation Workflow:
+1. Parse Question ID → Extract metadata + Upload audio recordings
+2. Run verification → Technical analysis of both models
+3. Review results → Side-by-side comparison
+4. Submit → Track in evaluation system""",
+)
+
+@st.cache_data(show_spinner=False)
+def _supported_languages_text(languages: FrozenSet[str]) -> str:
+    """Language list rendered from the app's allowed set so docs and validation can't drift."""
+    return ", ".join(f"{lang} (lowercase-lowercase pattern)" if lang[3:].isalpha() and lang[3:].islower() else lang
+                     for lang in sorted(languages))
+
+def render(languages: FrozenSet[str]):
+    """Render the Help page examples panel."""
+    st.markdown(_EXAMPLES_HEADER_MD)
+    for question_id, detected in _EXAMPLE_QUESTION_IDS:
+        st.code(question_id, language=None)
+        st.markdown(detected)
+    
+    st.markdown("#### Supported Languages:")
+    st.text(_supported_languages_text(languages))
+    
+    for block in _EXAMPLES_BLOCKS:
+        st.markdown(block)
@@ -0,0 +1,145 @@
+"""Checks for the audio validation helpers; run with `python -m unittest discover tests`."""
+import importlib.util
+import io
+import os
+import shutil
+import tempfile
+import types
+import unittest
+import uuid
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import soundfile as sf
+
+_APP_PATH = Path(__file__).resolve().parent.parent / "sxs-audio-file-validation.py"
+
+def _load_app():
+    """Import the app script as a module; main() only runs under `streamlit run`."""
+    spec = importlib.util.spec_from_file_location("sxs_audio_app", _APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+app = _load_app()
+
+def _write_wav(path: str, seconds: float, sample_rate: int = 16000):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    sf.write(path, (0.5 * np.sin(2 * np.pi * 220 * t)).astype('float32'), sample_rate)
+
+
+class AudioStatsKernelTest(unittest.TestCase):
+    """The pure-Python/numba kernel and its NumPy fallback must agree."""
+
+    def _blocks(self):
+        rng = np.random.default_rng(0)
+        yield rng.integers(-32768, 32768, (app.PROBE_FRAMES, 1)).astype(np.int16)
+        yield rng.integers(-32768, 32768, (app.PROBE_FRAMES, 2)).astype(np.int16)
+        # Full-scale extremes, exact zeros and a DC block
+        yield np.array([[-32768, 0], [32767, 0], [0, -1], [-32767, 1]], dtype=np.int16)
+        yield np.full((16, 3), 1200, dtype=np.int16)
+
+    def _assert_same(self, expected, actual):
+        self.assertEqual(expected[0], actual[0])
+        self.assertAlmostEqual(expected[1], actual[1], places=6)
+        self.assertEqual(expected[2:], actual[2:])
+
+    def test_python_kernel_matches_numpy(self):
+        for frames in self._blocks():
+            self._assert_same(app._audio_stats_numpy(frames), app._audio_stats(frames))
+
+    def test_jitted_kernel_matches_numpy(self):
+        try:
+            from numba import njit
+        except ImportError:
+            self.skipTest("numba is not installed")
+        kernel = njit(cache=False)(app._audio_stats)
+        for frames in self._blocks():
+            self._assert_same(app._audio_stats_numpy(frames), kernel(frames))
+
+    def test_counts_clipping_and_zero_crossings(self):
+        frames = np.array([[-32768], [32767], [100], [-5]], dtype=np.int16)
+        peak, _, clipped, zero_crossings = app._audio_stats_numpy(frames)
+        self.assertEqual((peak, clipped, zero_crossings), (32768.0, 2, 2))
+
+
+class VerificationCacheTest(unittest.TestCase):
+    """Host-dependent results must never be stored in the persisted verification cache."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        app._verify_saved_audio_cached.clear()
+        self.calls = []
+        validate = app.AudioFileValidator.validate_audio_stream
+
+        def counting_validate(validator, fp, name):
+            self.calls.append(name)
+            return validate(validator, fp, name)
+
+        patcher = mock.patch.object(app.AudioFileValidator, 'validate_audio_stream', counting_validate)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        app._verify_saved_audio_cached.clear()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _verify_twice(self, path: str, name: str):
+        sha = uuid.uuid4().hex
+        size = os.path.getsize(path)
+        return [app._verify_saved_audio(path, sha, size, name, None) for _ in range(2)]
+
+    def test_valid_result_is_cached(self):
+        path = os.path.join(self.tmp, "ok.wav")
+        _write_wav(path, 2.0)
+        first, second = self._verify_twice(path, "ok.wav")
+        self.assertTrue(first['is_valid'])
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, ["ok.wav"])
+
+    def test_fallback_result_is_not_cached(self):
+        path = os.path.join(self.tmp, "broken.mp3")
+        with open(path, 'wb') as fp:
+            fp.write(b"ID3" + os.urandom(4096))
+        with mock.patch.object(app, '_get_audioread', lambda: None):
+            first, _ = self._verify_twice(path, "broken.mp3")
+        self.assertFalse(first['is_valid'])
+        self.assertTrue(app._is_host_dependent(first))
+        self.assertEqual(self.calls, ["broken.mp3", "broken.mp3"])
+
+
+class AudioreadFallbackTest(unittest.TestCase):
+    """In-memory streams that libsndfile rejects are spilled to a temp file for audioread."""
+
+    def test_in_memory_stream_is_spilled_for_audioread(self):
+        data = b"ID3" + os.urandom(4096)
+        opened = []
+
+        class FakeAudio:
+            def __init__(self, path):
+                with open(path, 'rb') as fp:
+                    opened.append((path, fp.read()))
+                self.duration, self.samplerate, self.channels = 90.0, 44100, 2
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+        fake_audioread = types.SimpleNamespace(audio_open=FakeAudio,
+                                               NoBackendError=type('NoBackendError', (Exception,), {}))
+        with mock.patch.object(app, '_get_audioread', lambda: fake_audioread):
+            result = app.AudioFileValidator().validate_audio_stream(io.BytesIO(data), "clip.mp3")
+
+        self.assertTrue(result['is_valid'])
+        self.assertEqual(result['duration'], 90.0)
+        self.assertIn("Validated using fallback audioread reader", result['warnings'])
+        (path, contents), = opened
+        self.assertEqual(contents, data)
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()